@@ -10,6 +10,8 @@ import json
 from datetime import datetime
 import logging
 
+from src.sim.api import position_sigma, simulate_lineup_scores
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,6 +22,10 @@ class EnhancedChampionshipSystem:
     """
     
     def __init__(self):
+        # PCG64 generator; faster than the legacy Mersenne-Twister API
+        # and safe to split for parallel work later
+        self.rng = np.random.default_rng()
+
         # Data storage
         self.players_df = None
         self.defense_df = None
@@ -86,7 +92,7 @@ class EnhancedChampionshipSystem:
         """Process player data with all calculations"""
         # Add required columns if missing
         if 'Rst%' not in self.players_df.columns:
-            self.players_df['Rst%'] = np.random.uniform(5, 35, len(self.players_df))
+            self.players_df['Rst%'] = self.rng.uniform(5, 35, len(self.players_df))
             logger.info("Generated ownership projections")
         
         if 'boom_score' not in self.players_df.columns:
@@ -158,31 +164,19 @@ class EnhancedChampionshipSystem:
     
     def run_monte_carlo_simulation(self, lineup: Dict, n_sims=10000) -> Dict:
         """Run Monte Carlo simulation on a lineup"""
-        results = []
-        
-        for _ in range(n_sims):
-            sim_score = 0
-            for position, players in lineup.items():
-                for player_name in players:
-                    player_row = self.players_df[
-                        self.players_df['player'] == player_name
-                    ]
-                    if not player_row.empty:
-                        player = player_row.iloc[0]
-                        # Simulate performance with variance
-                        mean = player['projection']
-                        std = mean * 0.3  # 30% standard deviation
-                        score = np.random.normal(mean, std)
-                        sim_score += max(0, score)
-            
-            results.append(sim_score)
-        
+        names = [name for players in lineup.values() for name in players]
+        roster = self.players_df[self.players_df['player'].isin(names)]
+
+        mu = roster['projection'].to_numpy(np.float32)
+        sigma = position_sigma(mu, roster['position'])
+        results = simulate_lineup_scores(mu, sigma, n_sims, self.rng)
+
         return {
-            'mean': np.mean(results),
-            'median': np.median(results),
-            'ceiling': np.percentile(results, 95),
-            'floor': np.percentile(results, 5),
-            'boom_probability': sum(1 for r in results if r > 180) / n_sims
+            'mean': float(np.mean(results)),
+            'median': float(np.median(results)),
+            'ceiling': float(np.percentile(results, 95)),
+            'floor': float(np.percentile(results, 5)),
+            'boom_probability': float(np.count_nonzero(results > 180)) / n_sims
         }
     
     def analyze_slate_edge(self) -> Dict:
@@ -8,6 +8,21 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+def warm_sim_kernels():
+    """Compile the Numba sim kernels ahead of time.
+
+    The kernels are declared with cache=True, so running them once here
+    writes the compiled machine code to disk and the app's first Run
+    click loads it instead of paying several seconds of LLVM compilation.
+    """
+    import numpy as np
+    from src.sim.kernels import simulate_players
+
+    mu = np.ones(4, np.float32)
+    simulate_players(mu, (mu * 0.3).astype(np.float32), 16, 0)
+    print("Sim kernels compiled and cached")
+
+
 def main():
     """Create baseline data directory and files"""
     print("Building baseline data...")
@@ -23,7 +38,12 @@ def main():
     
     print(f"Created baseline directory at: {baseline_dir}")
     print("Baseline data ready!")
-    
+
+    try:
+        warm_sim_kernels()
+    except ImportError as e:
+        print(f"Skipping kernel warm-up (missing dependency: {e})")
+
     return 0
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Pandas-facing entry points for the Monte Carlo engine.
+
+Both UIs (the Streamlit simulator and the Flask championship system)
+call into this module, so correctness and speed fixes land once instead
+of being copy-pasted between apps.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .correlation import simulate_correlated
+from .kernels import (DEFAULT_VARIANCE, POSITION_VARIANCE, STAT_COLUMNS,
+                      simulate_players)
+from .worker import MP_THRESHOLD, simulate_players_mp, summarize
+
+
+def position_sigma(mu, positions=None):
+    """Per-player outcome spread from the position variance table.
+
+    Missing or unknown positions fall back to DEFAULT_VARIANCE.
+    """
+    if positions is None:
+        return (mu * DEFAULT_VARIANCE).astype(np.float32)
+    # Map on object values: a categorical POS column would otherwise come
+    # back categorical and reject the fallback as a new category
+    mult = pd.Series(np.asarray(positions, dtype=object)).map(POSITION_VARIANCE)
+    mult = mult.fillna(DEFAULT_VARIANCE).to_numpy(np.float32)
+    return (mu * mult).astype(np.float32)
+
+
+def run(df, proj_col, n_sims, seed, correlated=False):
+    """Simulate every player in df and return df plus the stats columns.
+
+    Dispatches to the correlated team sampler, the multiprocessing shard
+    path, or the position-specialized kernels depending on the settings,
+    the workload size and which columns the upload carries.
+    """
+    mu = df[proj_col].to_numpy(np.float32)
+    has_pos = 'POS' in df.columns
+    sigma = position_sigma(mu, df['POS'] if has_pos else None)
+
+    if correlated and has_pos and 'TEAM' in df.columns:
+        sims = simulate_correlated(
+            mu, sigma, df['TEAM'].to_numpy(), df['POS'].to_numpy(), n_sims, seed
+        )
+        stats = summarize(sims, mu)
+    elif n_sims * len(mu) >= MP_THRESHOLD:
+        stats = simulate_players_mp(mu, sigma, n_sims, seed)
+    else:
+        # sigma already carries the per-position variance, so the one
+        # disk-cached kernel covers every position
+        stats = simulate_players(mu, sigma, n_sims, seed)
+
+    # One concat instead of per-column inserts — each df[col] = ...
+    # triggers a block-manager consolidation pass
+    stats_df = pd.DataFrame(stats, columns=list(STAT_COLUMNS), index=df.index)
+
+    # 100 minus coefficient of variation, guarding near-zero projections
+    # (kickers and punt plays) that would blow the ratio up to +/-inf
+    cv = np.divide(stats[:, 1], stats[:, 0],
+                   out=np.full(len(df), np.nan, np.float32),
+                   where=stats[:, 0] > 0.1)
+    stats_df['consistency'] = 100.0 - cv * 100.0
+    return pd.concat([df, stats_df], axis=1)
+
+
+def simulate_lineup_scores(mu, sigma, n_sims, rng):
+    """Total fantasy points for one lineup across n_sims trials.
+
+    Draws all players at once, floors negative outcomes at zero, and
+    sums across the roster — the vectorized form of the old per-player
+    per-trial Python loop.
+    """
+    draws = mu + sigma * rng.standard_normal((n_sims, mu.shape[0]), dtype=np.float32)
+    np.clip(draws, 0.0, None, out=draws)
+    return draws.sum(axis=1)
@@ -0,0 +1,74 @@
+"""Correlated player sampling via per-team Cholesky factors."""
+
+import numpy as np
+import pandas as pd
+
+# Pairwise same-team correlations by position, mirroring the stacking
+# boosts in EnhancedChampionshipSystem.correlation_boosts. Cross-team
+# effects (QB vs. opposing WR) are left out until opponents are wired
+# into the sim inputs.
+STACK_CORRELATIONS = {
+    ('QB', 'WR'): 0.30,
+    ('QB', 'TE'): 0.20,
+    ('QB', 'RB'): -0.10,
+    ('RB', 'D'): 0.18,
+}
+
+
+def _team_correlation(positions):
+    """Build the k x k correlation matrix for one team's players."""
+    k = len(positions)
+    corr = np.eye(k)
+    for a in range(k):
+        for b in range(a + 1, k):
+            pair = (positions[a], positions[b])
+            rho = STACK_CORRELATIONS.get(
+                pair, STACK_CORRELATIONS.get((pair[1], pair[0]), 0.0)
+            )
+            corr[a, b] = corr[b, a] = rho
+    return corr
+
+
+def _safe_cholesky(corr):
+    """Factor corr, repairing indefinite matrices by eigenvalue clipping.
+
+    Pairwise position lookups can go indefinite when a team carries many
+    players at the same correlated position (e.g. two QBs and six WRs).
+    """
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        w, v = np.linalg.eigh(corr)
+        fixed = (v * np.clip(w, 1e-6, None)) @ v.T
+        d = np.sqrt(np.diag(fixed))
+        fixed = fixed / np.outer(d, d)
+        return np.linalg.cholesky(fixed + 1e-9 * np.eye(len(corr)))
+
+
+def simulate_correlated(mu, sigma, teams, positions, n_sims, seed):
+    """Draw correlated fantasy-point trajectories team by team.
+
+    One Cholesky factor and one BLAS matmul per team replaces any
+    per-pair Python adjustment; players on different teams stay
+    independent. Returns the full (n_sims, n_players) float32 matrix.
+    """
+    rng = np.random.default_rng(seed)
+    positions = np.asarray(positions, dtype=object)
+    # factorize instead of np.unique: blank TEAM cells become code -1
+    # rather than NaNs that cannot sort against strings
+    codes, _ = pd.factorize(np.asarray(teams, dtype=object))
+
+    sims = np.empty((n_sims, mu.shape[0]), np.float32)
+    for code in range(-1, codes.max() + 1):
+        idx = np.flatnonzero(codes == code)
+        if idx.size == 0:
+            continue
+        if code == -1:
+            # Players without a team stay mutually independent
+            z = rng.standard_normal((idx.size, n_sims))
+        else:
+            corr = _team_correlation(list(positions[idx]))
+            L = _safe_cholesky(corr)
+            z = L @ rng.standard_normal((idx.size, n_sims))
+        sims[:, idx] = mu[idx] + z.T.astype(np.float32) * sigma[idx]
+    return sims
@@ -0,0 +1,98 @@
+"""Numba-compiled Monte Carlo kernels for player simulations."""
+
+import numpy as np
+from numba import njit, prange
+
+# Column layout of the stats arrays returned by the kernels
+STAT_COLUMNS = ('sim_mean', 'sim_std', 'floor_p10', 'sim_median',
+                'ceiling_p90', 'boom_score')
+
+# Outcome spread as a fraction of projection, by position: passing
+# production is steadier than WR/TE target luck, kickers are a coin flip
+POSITION_VARIANCE = {
+    'QB': 0.25,
+    'RB': 0.32,
+    'WR': 0.38,
+    'TE': 0.40,
+    'D': 0.35,
+    'DST': 0.35,
+    'K': 0.45,
+}
+DEFAULT_VARIANCE = 0.30
+BOOM_MULT = 1.5
+
+# Exact norm.ppf(0.9); the draws are Gaussian, so mean +/- Z90 * std IS
+# the 10th/90th percentile — no need to sort the samples to find it
+Z90 = np.float32(1.2815515655446004)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def simulate_players(mu, sigma, n_sims, seed):
+    """Simulate n_sims fantasy-point outcomes for each player.
+
+    Each player's trajectories run on their own prange worker and are
+    reduced online, so the full (n_sims, n_players) matrix is never
+    materialized; floor/ceiling come from the exact Gaussian quantile
+    (mean +/- Z90 * std) rather than sorting the samples.
+
+    Returns an (n_players, 6) float32 array with columns
+    [sim_mean, sim_std, floor_p10, sim_median, ceiling_p90, boom_score].
+    """
+    n_players = mu.shape[0]
+    out = np.empty((n_players, 6), np.float32)
+    for i in prange(n_players):
+        # Seed per player so results are reproducible no matter how
+        # prange assigns players to threads.
+        np.random.seed(seed + i)
+        # Welford's online mean/variance: single pass, no catastrophic
+        # cancellation from a sum-of-squares accumulator
+        mean = 0.0
+        m2 = 0.0
+        boom = 0
+        boom_line = 1.5 * mu[i]
+        for s in range(n_sims):
+            x = mu[i] + sigma[i] * np.random.standard_normal()
+            delta = x - mean
+            mean += delta / (s + 1)
+            m2 += delta * (x - mean)
+            if x > boom_line:
+                boom += 1
+        std = np.sqrt(m2 / n_sims)
+        out[i, 0] = mean
+        out[i, 1] = std
+        out[i, 2] = mean - Z90 * std
+        out[i, 3] = mean
+        out[i, 4] = mean + Z90 * std
+        out[i, 5] = boom / n_sims * 100.0
+    return out
+
+
+def warm_kernels():
+    """Compile (or load from the on-disk cache) the sim kernel.
+
+    Called at app start so the first Run click never pays the LLVM
+    compile; with the cache written by scripts/build_baseline.py this is
+    a sub-second load. Kept synchronous and on the main thread — numba
+    compilation kicked off from a background thread wedges interpreter
+    shutdown.
+    """
+    mu = np.ones(1, np.float32)
+    simulate_players(mu, (mu * 0.3).astype(np.float32), 2, 0)
+
+
+def simulate_by_position(mu, positions, n_sims, seed):
+    """Simulate with per-position variance.
+
+    Position only changes a player's sigma, so one disk-cached kernel
+    covers every position: look up the variance multipliers (missing or
+    unknown positions fall back to DEFAULT_VARIANCE) and hand the
+    per-player sigma vector to simulate_players. Closure-specialized
+    kernels per position were tried, but closures cannot use numba's
+    cache=True and re-paid the full JIT cost in every fresh process.
+    """
+    mults = np.array(
+        [POSITION_VARIANCE.get(p, DEFAULT_VARIANCE)
+         for p in np.asarray(positions, dtype=object)],
+        np.float32,
+    )
+    return simulate_players(mu, (mu * mults).astype(np.float32), n_sims, seed)
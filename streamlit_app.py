@@ -0,0 +1,161 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+import json
+import io
+import zipfile
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from src.sim import api as sim_api
+from src.sim.kernels import warm_kernels
+
+
+@st.cache_data(show_spinner=False)
+def load_csv(data: bytes) -> pd.DataFrame:
+    """Parse the uploaded CSV once per unique file; reruns hit the cache."""
+    df = pd.read_csv(io.BytesIO(data))
+    # Low-cardinality string columns: categorical codes make the grouping
+    # in the sim paths an int scan instead of re-hashing strings
+    for col in ('POS', 'TEAM', 'OPP'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def numeric_columns(data: bytes) -> tuple:
+    """Selectbox options, computed once per upload.
+
+    Rebuilding df.columns.tolist() on every rerun rescans the frame per
+    keystroke; a cached tuple also hashes cheaply as a cache key.
+    """
+    return tuple(load_csv(data).select_dtypes(include=np.number).columns)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def run_sim(file_bytes: bytes, proj_col: str, n_sims: int, seed: int,
+            correlated: bool = False) -> pd.DataFrame:
+    """Run the Monte Carlo for one (file, settings) combination.
+
+    The cache key is derived from the argument hashes, so re-running with
+    identical settings — or flipping back to a recent combination — is free.
+    """
+    df = load_csv(file_bytes).copy()
+    return sim_api.run(df, proj_col, n_sims, seed, correlated)
+
+
+st.set_page_config(page_title="NFL GPP Sim Optimizer", page_icon="🏈", layout="wide")
+
+# Load the compiled sim kernel (sub-second from the disk cache) before
+# the first Run click instead of during it
+warm_kernels()
+st.title("🏈 NFL GPP Sim Optimizer")
+st.markdown("Monte Carlo simulation engine for NFL DFS projections")
+
+# Session state
+if 'sim_results' not in st.session_state:
+    st.session_state.sim_results = None
+
+# Tabs
+tabs = st.tabs(["📊 Simulator", "📚 Instructions"])
+
+with tabs[0]:
+    st.header("Monte Carlo Simulator")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        uploaded_file = st.file_uploader(
+            "Upload players.csv from DFS site",
+            type=['csv'],
+            help="CSV with player projections, salaries, ownership"
+        )
+
+    with col2:
+        st.subheader("Settings")
+        n_sims = st.number_input("Simulations", min_value=1000, max_value=100000, value=10000, step=1000)
+        seed = st.number_input("Random Seed", min_value=0, max_value=999999, value=42)
+        use_correlations = st.checkbox(
+            "Correlate team stacks",
+            value=False,
+            help="Sample QB/WR/TE/RB outcomes jointly within each team"
+        )
+
+    if uploaded_file:
+        df = load_csv(uploaded_file.getvalue())
+        st.success(f"Loaded {len(df)} players")
+
+        # Show data preview
+        st.subheader("Data Preview")
+        st.dataframe(df.head(10))
+
+        numeric_cols = numeric_columns(uploaded_file.getvalue())
+        proj_col = st.selectbox(
+            "Projection column",
+            numeric_cols,
+            index=numeric_cols.index('FPTS') if 'FPTS' in numeric_cols else 0
+        )
+
+        if st.button("🚀 Run Simulation", type="primary"):
+            # Single status element; staged progress updates each force a
+            # rerun/websocket flush that costs more than the sim itself
+            with st.status(f"Running {n_sims:,} simulations...", expanded=False) as status:
+                st.session_state.sim_results = run_sim(
+                    uploaded_file.getvalue(), proj_col, int(n_sims), int(seed),
+                    use_correlations
+                )
+                status.update(label="Simulation complete", state="complete")
+
+        if st.session_state.sim_results is not None:
+            results = st.session_state.sim_results
+            st.subheader("Results")
+            st.dataframe(results)
+
+            st.subheader("Top Boom Plays")
+            # O(N) top-k selection; sorting the whole column for ten rows
+            # is wasted work once pools grow past a single slate
+            scores = results['boom_score'].to_numpy()
+            k = min(10, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            id_cols = [c for c in ('PLAYER', 'POS', 'TEAM') if c in results.columns]
+            st.dataframe(results.iloc[top][id_cols + ['boom_score', 'ceiling_p90']])
+
+            # Serialize straight to bytes; to_csv would build the whole
+            # file as a Python str and re-encode it
+            buf = io.BytesIO()
+            pacsv.write_csv(
+                pa.Table.from_pandas(st.session_state.sim_results, preserve_index=False),
+                buf
+            )
+            st.download_button(
+                "📥 Download Results",
+                data=buf.getvalue(),
+                file_name='sim_results.csv',
+                mime='text/csv'
+            )
+
+with tabs[1]:
+    st.header("How to Use")
+    st.markdown("""
+    ### NFL GPP Monte Carlo Simulator
+
+    1. **Upload Your File**: Upload your DFS site's players.csv
+    2. **Configure Settings**: Choose number of simulations
+    3. **Run Simulation**: Click the Run button
+    4. **Download Results**: Get your projections
+
+    ### Required Columns:
+    - PLAYER: Player name
+    - POS: Position
+    - TEAM: Team
+    - OPP: Opponent
+    - FPTS: Projected points (optional)
+    - SAL: Salary (optional)
+    - RST%: Ownership (optional)
+    """)